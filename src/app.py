@@ -14,29 +14,254 @@ The application uses Flask to provide RESTful API endpoints for cube operations
 and serves a responsive web interface for user interaction.
 """
 
-from flask import Flask, render_template, request, jsonify
+from flask import Flask, render_template, request, jsonify, g
+from flask.json.provider import JSONProvider
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from concurrent.futures.process import BrokenProcessPool
+from functools import wraps
+from uuid import uuid4
+import multiprocessing
 import sys
 import os
+import threading
+import numpy as np
+import orjson
+from cachetools import LRUCache
 
 # Import cube-related modules for core functionality
-from .cube.cube import Cube
-from .cube.solver import generate_solution
+from .cube.cube import Cube, compose_moves, move_permutations
+from .cube.solver import solve_state
 from .scramble.generator import gen_scramble
 from .scramble.parser import moves_to_scramble
 
+class OrjsonProvider(JSONProvider):
+    """
+    Flask JSON provider backed by orjson instead of the stdlib json module.
+    
+    Every API response carries the cube state, so encoding speed matters;
+    numeric NumPy arrays are serialized natively without tolist().
+    """
+    
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj, option=orjson.OPT_SERIALIZE_NUMPY).decode()
+    
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
 # Configure Flask application with frontend templates and static files
 app = Flask(__name__, template_folder='frontend', static_folder='frontend', static_url_path='')
+app.json = OrjsonProvider(app)
+
+# Cookie identifying the browser session a request belongs to
+SESSION_COOKIE = 'session_id'
+
+# Maximum number of sessions kept in memory (least recently used are dropped).
+# Every state-changing request without a known cookie starts a session, so
+# clients ignoring cookies can evict idle users, whose next request then
+# starts over from a solved cube outside step mode. Read-only GETs never
+# start a session (see get_session).
+MAX_SESSIONS = 1024
+
+# Packed sticker state of a solved cube, returned if a state cannot be read
+SOLVED_STATE = Cube(3).flat.tobytes().hex()
+
+def new_process_pool():
+    """
+    Start a pool of worker processes for the CPU-bound solver.
+    
+    Workers are spawned rather than forked since the server is
+    multi-threaded; they run solver.solve_state, so they never import
+    this module.
+    
+    Returns:
+        ProcessPoolExecutor: Pool with one worker per CPU
+    """
+    return ProcessPoolExecutor(max_workers=os.cpu_count(),
+                               mp_context=multiprocessing.get_context('spawn'))
 
-# Global cube instance for maintaining state across requests
-cube = None
+# Worker processes running the solver outside the request threads
+PROCESS_POOL = new_process_pool()
 
-# Step-by-step solving mode data structure
-step_mode_data = {
-    'active': False,
-    'solution_moves': [],
-    'current_step': 0,
-    'step_cube_states': []
-}
+# Seconds a request waits for a solution before the solve is abandoned
+SOLVE_TIMEOUT = 10
+
+# Guards replacing PROCESS_POOL after a solve timed out or the pool broke
+pool_lock = threading.Lock()
+
+def inactive_step_mode():
+    """
+    Build the step-by-step solving mode data of a session not in step mode.
+    
+    Returns:
+        dict: Step mode data structure with step mode deactivated
+    """
+    return {
+        'active': False,
+        'solution_moves': [],
+        'current_step': 0,
+        'step_cube_states': []
+    }
+
+class CubeSession:
+    """
+    Cube state belonging to a single browser session.
+    
+    Attributes:
+        cube (Cube): The session's cube, solved when the session starts
+        step_mode_data (dict): Step-by-step solving mode data structure
+        lock (threading.Lock): Serializes requests of this session only
+    """
+    
+    def __init__(self):
+        self.cube = Cube(3)
+        self.step_mode_data = inactive_step_mode()
+        self.lock = threading.Lock()
+
+# Server-side session table keyed by the session cookie
+sessions = LRUCache(maxsize=MAX_SESSIONS)
+
+# Guards lookups in the session table (LRUCache reorders itself on access);
+# it is never held while a cube is being worked on
+sessions_lock = threading.Lock()
+
+def get_session(create: bool = True):
+    """
+    Find the session of the current request, starting a new one if needed.
+    
+    Requests without a known session cookie get a fresh session; its id is
+    stored in flask.g so that the response hands out the cookie. With
+    create=False the fresh session is only transient: it is not stored and
+    no cookie is handed out, so it takes no slot in the session table.
+    
+    Args:
+        create (bool): Whether an unknown request starts a stored session
+    
+    Returns:
+        CubeSession: The session of the requesting browser
+    """
+    session_id = request.cookies.get(SESSION_COOKIE)
+    
+    with sessions_lock:
+        session = sessions.get(session_id) if session_id else None
+        if session is None:
+            session = CubeSession()
+            if create:
+                session_id = uuid4().hex
+                sessions[session_id] = session
+                g.new_session_id = session_id
+    
+    return session
+
+def with_session(view):
+    """
+    Run a view with the requesting browser's session, holding its lock.
+    
+    Requests from different sessions run concurrently, while requests of the
+    same session are serialized so they cannot race on its cube. Read-only
+    GET requests never start a stored session.
+    
+    Args:
+        view: View function taking the CubeSession as first argument
+        
+    Returns:
+        Wrapped view function suitable for app.route
+    """
+    @wraps(view)
+    def wrapper(*args, **kwargs):
+        session = get_session(create=request.method != 'GET')
+        with session.lock:
+            return view(session, *args, **kwargs)
+    return wrapper
+
+def recycle_pool(pool):
+    """
+    Replace a process pool that is broken or has a worker stuck on a solve.
+    
+    A single worker of a ProcessPoolExecutor cannot be stopped, so the pool
+    is swapped for a fresh one and its processes are terminated. Other
+    solves still running on the old pool fail and report an error.
+    
+    Args:
+        pool (ProcessPoolExecutor): The pool to retire
+        
+    Returns:
+        ProcessPoolExecutor: The pool now in PROCESS_POOL
+    """
+    global PROCESS_POOL
+
+    with pool_lock:
+        if PROCESS_POOL is not pool:
+            return PROCESS_POOL  # Already replaced by another request
+
+        PROCESS_POOL = new_process_pool()
+        # The executor drops its process table on shutdown (or once broken)
+        processes = list((pool._processes or {}).values())
+
+    for process in processes:
+        process.terminate()
+    pool.shutdown(wait=False, cancel_futures=True)
+
+    return PROCESS_POOL
+
+def solve_in_pool(cube):
+    """
+    Generate a solution for the cube in a worker process.
+    
+    The calling request thread only waits on the result, so other requests
+    keep being served while the solver runs on another core. A solve that
+    takes longer than SOLVE_TIMEOUT seconds is abandoned: it is cancelled
+    if it has not started yet, otherwise its pool is recycled.
+    
+    Args:
+        cube (Cube): The cube to solve (left unchanged)
+        
+    Returns:
+        List[Move]: Sequence of moves that will solve the cube
+        
+    A pool that broke (e.g. a worker was killed) is replaced: a solve
+    that could not be submitted is retried once on the fresh pool.
+    
+    Raises:
+        TimeoutError: If no solution was found within SOLVE_TIMEOUT seconds
+        BrokenProcessPool: If the worker died while running this solve
+    """
+    state = cube.flat.tobytes()
+    pool = PROCESS_POOL
+
+    try:
+        future = pool.submit(solve_state, state, cube.size)
+    except RuntimeError:
+        # Broken (BrokenProcessPool is a RuntimeError) or already shut down
+        # by another request recycling it
+        pool = recycle_pool(pool)
+        future = pool.submit(solve_state, state, cube.size)
+
+    try:
+        return future.result(timeout=SOLVE_TIMEOUT)
+    except FutureTimeoutError:
+        if not future.cancel():
+            recycle_pool(pool)
+        raise TimeoutError(f"Solver did not finish within {SOLVE_TIMEOUT} seconds") from None
+    except BrokenProcessPool:
+        recycle_pool(pool)
+        raise
+
+@app.after_request
+def set_session_cookie(response):
+    """
+    Attach the session cookie to responses of newly started sessions.
+    
+    Args:
+        response: The outgoing Flask response
+        
+    Returns:
+        The response, with the cookie set if a session was created
+    """
+    session_id = g.pop('new_session_id', None)
+    if session_id:
+        response.set_cookie(SESSION_COOKIE, session_id, httponly=True, samesite='Lax')
+    return response
 
 @app.route('/')
 def index():
@@ -49,7 +274,8 @@ def index():
     return render_template('index.html')
 
 @app.route('/api/new_cube', methods=['POST'])
-def new_cube():
+@with_session
+def new_cube(session):
     """
     Initialize a new solved Rubik's cube.
     
@@ -58,21 +284,20 @@ def new_cube():
     Returns:
         dict: JSON response containing success status, message, and cube state
     """
-    global cube
-    cube = Cube(3)
+    session.cube = Cube(3)
     return jsonify({
         'status': 'success',
         'message': 'New cube created',
-        'cube_state': get_cube_state()
+        'cube_state': get_cube_state(session.cube)
     })
 
 @app.route('/api/scramble', methods=['POST'])
-def scramble_cube():
+@with_session
+def scramble_cube(session):
     """
     Apply a random scramble sequence to the cube.
     
     Generates a random scrambling algorithm and applies it to the current cube.
-    If no cube exists, creates a new one first.
     
     Returns:
         dict: JSON response with scramble sequence applied and resulting cube state
@@ -80,9 +305,7 @@ def scramble_cube():
     Raises:
         Exception: If scramble generation or application fails
     """
-    global cube
-    if cube is None:
-        cube = Cube(3)
+    cube = session.cube
     
     try:
         scramble = gen_scramble()
@@ -90,7 +313,7 @@ def scramble_cube():
         return jsonify({
             'status': 'success',
             'scramble': scramble,
-            'cube_state': get_cube_state()
+            'cube_state': get_cube_state(cube)
         })
     except Exception as e:
         return jsonify({
@@ -99,7 +322,8 @@ def scramble_cube():
         })
 
 @app.route('/api/move', methods=['POST'])
-def make_move():
+@with_session
+def make_move(session):
     """
     Execute a single move or sequence of moves on the cube.
     
@@ -113,14 +337,9 @@ def make_move():
         dict: JSON response with move applied and resulting cube state
         
     Raises:
-        Exception: If move notation is invalid or cube is uninitialized
+        Exception: If move notation is invalid
     """
-    global cube
-    if cube is None:
-        return jsonify({
-            'status': 'error',
-            'message': 'No cube initialized'
-        })
+    cube = session.cube
     
     data = request.get_json()
     move = data.get('move', '')
@@ -130,7 +349,7 @@ def make_move():
         return jsonify({
             'status': 'success',
             'move': move,
-            'cube_state': get_cube_state()
+            'cube_state': get_cube_state(cube)
         })
     except Exception as e:
         return jsonify({
@@ -139,7 +358,8 @@ def make_move():
         })
 
 @app.route('/api/solve', methods=['POST'])
-def solve_cube():
+@with_session
+def solve_cube(session):
     """
     Generate a complete solution for the current cube.
     
@@ -152,23 +372,18 @@ def solve_cube():
         - cube_state: Current state of the cube
         
     Raises:
-        Exception: If cube is uninitialized or solving algorithm fails
+        Exception: If solving algorithm fails
     """
-    global cube
-    if cube is None:
-        return jsonify({
-            'status': 'error',
-            'message': 'No cube initialized'
-        })
+    cube = session.cube
     
     try:
-        solution_moves = generate_solution(cube)
+        solution_moves = solve_in_pool(cube)
         solution = moves_to_scramble(solution_moves)
         return jsonify({
             'status': 'success',
             'solution': solution,
             'move_count': len(solution_moves),
-            'cube_state': get_cube_state()
+            'cube_state': get_cube_state(cube)
         })
     except Exception as e:
         return jsonify({
@@ -177,7 +392,8 @@ def solve_cube():
         })
 
 @app.route('/api/reset', methods=['POST'])
-def reset_cube():
+@with_session
+def reset_cube(session):
     """
     Reset the cube to its solved state.
     
@@ -187,37 +403,33 @@ def reset_cube():
     Returns:
         dict: JSON response confirming reset and providing solved cube state
     """
-    global cube
-    cube = Cube(3)  # Create a new solved cube
+    session.cube = Cube(3)  # Create a new solved cube
     
     return jsonify({
         'status': 'success',
         'message': 'Cube reset to solved state',
-        'cube_state': get_cube_state()
+        'cube_state': get_cube_state(session.cube)
     })
 
 @app.route('/api/state', methods=['GET'])
-def get_state():
+@with_session
+def get_state(session):
     """
     Retrieve the current state of the cube.
     
     Returns the complete state representation of all six faces of the cube.
-    If no cube exists, creates a new solved cube.
     
     Returns:
         dict: JSON response containing the current cube state representation
     """
-    global cube
-    if cube is None:
-        cube = Cube(3)
-    
     return jsonify({
         'status': 'success',
-        'cube_state': get_cube_state()
+        'cube_state': get_cube_state(session.cube)
     })
 
 @app.route('/api/apply_scramble', methods=['POST'])
-def apply_scramble():
+@with_session
+def apply_scramble(session):
     """
     Apply a custom scramble sequence to the cube.
     
@@ -234,7 +446,6 @@ def apply_scramble():
     Raises:
         Exception: If scramble sequence contains invalid moves
     """
-    global cube
     data = request.get_json()
     scramble = data.get('scramble', '').strip()
     
@@ -245,12 +456,12 @@ def apply_scramble():
         })
     
     try:
-        cube = Cube(3)  # Reset to solved state first
-        cube.do_moves(scramble)
+        cube = session.cube = Cube(3)  # Reset to solved state first
+        cube.apply_permutation(compose_moves(scramble))
         return jsonify({
             'status': 'success',
             'scramble': scramble,
-            'cube_state': get_cube_state()
+            'cube_state': get_cube_state(cube)
         })
     except Exception as e:
         return jsonify({
@@ -259,7 +470,8 @@ def apply_scramble():
         })
 
 @app.route('/api/step_solve/start', methods=['POST'])
-def start_step_solve():
+@with_session
+def start_step_solve(session):
     """
     Initialize step-by-step solving mode.
     
@@ -275,34 +487,29 @@ def start_step_solve():
         - cube_state: Current state of the cube
         
     Raises:
-        Exception: If cube is uninitialized or solution generation fails
+        Exception: If solution generation fails
     """
-    global cube, step_mode_data
-    if cube is None:
-        return jsonify({
-            'status': 'error',
-            'message': 'No cube initialized'
-        })
+    cube = session.cube
     
     try:
         # Generate solution
-        solution_moves = generate_solution(cube)
+        solution_moves = solve_in_pool(cube)
         solution = moves_to_scramble(solution_moves)
         solution_list = solution.split()
         
-        # Store initial cube state and generate all intermediate states
-        step_cube_states = []
-        temp_cube = Cube(3)
-        temp_cube.faces = {face: [row[:] for row in cube.faces[face]] for face in cube.faces}
-        step_cube_states.append({face: [row[:] for row in temp_cube.faces[face]] for face in temp_cube.faces})
+        # Prefix table: row i is the permutation of the first i moves
+        perms = move_permutations(cube.size)
+        prefix = np.empty((len(solution_list) + 1, cube.flat.size), dtype=np.intp)
+        prefix[0] = np.arange(cube.flat.size)
         
-        # Generate all intermediate states
-        for move in solution_list:
-            temp_cube.do_moves(move)
-            step_cube_states.append({face: [row[:] for row in temp_cube.faces[face]] for face in temp_cube.faces})
+        for i, move in enumerate(solution_list):
+            prefix[i + 1] = prefix[i][perms[move]]
+        
+        # Generate all intermediate states with one gather
+        step_cube_states = cube.flat[prefix]
         
         # Set up step mode
-        step_mode_data = {
+        session.step_mode_data = {
             'active': True,
             'solution_moves': solution_list,
             'current_step': 0,
@@ -317,7 +524,7 @@ def start_step_solve():
             'total_steps': len(solution_list),
             'current_step': 0,
             'current_move': first_move,
-            'cube_state': get_cube_state()
+            'cube_state': get_cube_state(cube)
         })
     except Exception as e:
         return jsonify({
@@ -326,7 +533,8 @@ def start_step_solve():
         })
 
 @app.route('/api/step_solve/next', methods=['POST'])
-def next_step():
+@with_session
+def next_step(session):
     """
     Advance to the next step in the step-by-step solution.
     
@@ -339,7 +547,8 @@ def next_step():
     Raises:
         Exception: If step mode is not active or already at final step
     """
-    global cube, step_mode_data
+    cube = session.cube
+    step_mode_data = session.step_mode_data
     
     if not step_mode_data['active']:
         return jsonify({
@@ -354,8 +563,7 @@ def next_step():
         })
     
     step_mode_data['current_step'] += 1
-    cube.faces = {face: [row[:] for row in step_mode_data['step_cube_states'][step_mode_data['current_step']][face]] 
-                  for face in step_mode_data['step_cube_states'][step_mode_data['current_step']]}
+    cube.flat = step_mode_data['step_cube_states'][step_mode_data['current_step']].copy()
     
     # Show the next move to be taken, not the current move
     if step_mode_data['current_step'] < len(step_mode_data['solution_moves']):
@@ -368,11 +576,12 @@ def next_step():
         'current_step': step_mode_data['current_step'],
         'total_steps': len(step_mode_data['solution_moves']),
         'current_move': next_move,
-        'cube_state': get_cube_state()
+        'cube_state': get_cube_state(cube)
     })
 
 @app.route('/api/step_solve/prev', methods=['POST'])
-def prev_step():
+@with_session
+def prev_step(session):
     """
     Go back to the previous step in the step-by-step solution.
     
@@ -385,7 +594,8 @@ def prev_step():
     Raises:
         Exception: If step mode is not active or already at first step
     """
-    global cube, step_mode_data
+    cube = session.cube
+    step_mode_data = session.step_mode_data
     
     if not step_mode_data['active']:
         return jsonify({
@@ -400,8 +610,7 @@ def prev_step():
         })
     
     step_mode_data['current_step'] -= 1
-    cube.faces = {face: [row[:] for row in step_mode_data['step_cube_states'][step_mode_data['current_step']][face]] 
-                  for face in step_mode_data['step_cube_states'][step_mode_data['current_step']]}
+    cube.flat = step_mode_data['step_cube_states'][step_mode_data['current_step']].copy()
     
     # Show the next move to be taken, not the current move
     if step_mode_data['current_step'] < len(step_mode_data['solution_moves']):
@@ -414,11 +623,12 @@ def prev_step():
         'current_step': step_mode_data['current_step'],
         'total_steps': len(step_mode_data['solution_moves']),
         'current_move': next_move,
-        'cube_state': get_cube_state()
+        'cube_state': get_cube_state(cube)
     })
 
 @app.route('/api/step_solve/stop', methods=['POST'])
-def stop_step_solve():
+@with_session
+def stop_step_solve(session):
     """
     Exit step-by-step solving mode.
     
@@ -428,14 +638,7 @@ def stop_step_solve():
     Returns:
         dict: JSON response confirming step mode has been stopped
     """
-    global step_mode_data
-    
-    step_mode_data = {
-        'active': False,
-        'solution_moves': [],
-        'current_step': 0,
-        'step_cube_states': []
-    }
+    session.step_mode_data = inactive_step_mode()
     
     return jsonify({
         'status': 'success',
@@ -443,7 +646,8 @@ def stop_step_solve():
     })
 
 @app.route('/api/step_solve/status', methods=['GET'])
-def step_solve_status():
+@with_session
+def step_solve_status(session):
     """
     Get the current status of step-by-step solving mode.
     
@@ -453,6 +657,8 @@ def step_solve_status():
     Returns:
         dict: JSON response containing step mode status and progress information
     """
+    step_mode_data = session.step_mode_data
+    
     if step_mode_data['active']:
         # Show the next move to be taken, not the current move
         if step_mode_data['current_step'] < len(step_mode_data['solution_moves']):
@@ -473,73 +679,44 @@ def step_solve_status():
             'active': False
         })
 
-def get_cube_state():
+def get_cube_state(cube):
     """
     Convert the internal cube representation to a web-friendly format.
     
-    Transforms the cube's 3D face arrays with RGB color tuples into
-    a flat dictionary structure with single-letter color codes suitable
-    for JSON serialization and frontend consumption.
+    The stickers are sent as one hex string of colour IDs, face after face
+    in FACE_INDEX order (U, F, L, B, R, D), 9 stickers per face. The
+    frontend unpacks it into colour letters (see decodeCubeState in
+    cubeapi.js).
+    
+    Args:
+        cube (Cube): The cube to convert
     
     Returns:
-        dict: Cube state with color-coded faces or None if no cube exists
+        dict: Cube state with packed stickers or None if no cube exists
         
     The returned dictionary contains:
-    - Six face arrays (front, back, left, right, up, down)
-    - Each face contains 9 color letters (W, Y, R, O, B, G)
+    - state: 108 hex characters, two per sticker
     - Boolean flag indicating if cube is solved
     """
     if cube is None:
         return None
     
     try:
-        # Convert color tuples to single letter representation
-        def color_to_letter(color_tuple):
-            color_map = {
-                (255, 255, 255): 'W',  # White
-                (255, 255, 0): 'Y',    # Yellow
-                (255, 0, 0): 'R',      # Red
-                (255, 165, 0): 'O',    # Orange
-                (0, 0, 255): 'B',      # Blue
-                (0, 255, 0): 'G'       # Green
-            }
-            return color_map.get(color_tuple, 'W')
-        
-        # Convert 3x3 face array to flat list of color letters
-        def face_to_colors(face):
-            colors = []
-            for row in face:
-                for color_tuple in row:
-                    colors.append(color_to_letter(color_tuple))
-            return colors
-        
         return {
-            'front': face_to_colors(cube.faces['F']),
-            'back': face_to_colors(cube.faces['B']),
-            'left': face_to_colors(cube.faces['L']),
-            'right': face_to_colors(cube.faces['R']),
-            'up': face_to_colors(cube.faces['U']),
-            'down': face_to_colors(cube.faces['D']),
+            'state': cube.flat.tobytes().hex(),
             'is_solved': cube.is_solved()
         }
     except Exception as e:
         print(f"Error getting cube state: {e}")
         # Fallback - return a default solved state
-        default_colors = ['W'] * 9
         return {
-            'front': ['G'] * 9,
-            'back': ['B'] * 9, 
-            'left': ['O'] * 9,
-            'right': ['R'] * 9,
-            'up': ['W'] * 9,
-            'down': ['Y'] * 9,
+            'state': SOLVED_STATE,
             'is_solved': True
         }
 
+
 if __name__ == '__main__':
-    # Initialize the application with a new solved cube
-    cube = Cube(3)
-    
     # Start the Flask development server with debug mode enabled
-    # Server is accessible from any network interface on port 5000
-    app.run(debug=True, host='0.0.0.0', port=5000)
+    # Server is accessible from any network interface on port 5000;
+    # requests are handled in threads, each session holding its own lock
+    app.run(debug=True, host='0.0.0.0', port=5000, threaded=True)
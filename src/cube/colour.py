@@ -2,8 +2,11 @@
 Rubik's Cube Color System
 
 This module defines the color representation and standard color scheme
-for a Rubik's cube. Colors are represented as RGB tuples and mapped
-to their corresponding faces in the standard orientation.
+for a Rubik's cube. Colors are represented as small integer IDs (0-5) so
+that a whole cube fits in a compact uint8 array, and mapped to their
+corresponding faces in the standard orientation. The web API sends them
+as a hex string of these IDs; the frontend maps each ID to its colour
+(see decodeCubeState in cubeapi.js).
 
 Standard Rubik's Cube Color Scheme:
 - White: Opposite Yellow (Up/Down faces)
@@ -16,19 +19,19 @@ The initial mapping follows the standard cube orientation where:
 - Red is Right, Orange is Left
 """
 
-from typing import NewType, Tuple
+from typing import NewType
 
 
-# Type definition for RGB color representation
-Colour = NewType("Colour", Tuple[int, int, int])
+# Type definition for color IDs stored in the cube array
+Colour = NewType("Colour", int)
 
-# Standard Rubik's cube colors as RGB tuples
-WHITE = Colour((255, 255, 255))   # Up face
-GREEN = Colour((0, 255, 0))       # Front face
-ORANGE = Colour((255, 165, 0))    # Left face
-YELLOW = Colour((255, 255, 0))    # Down face
-BLUE = Colour((0, 0, 255))        # Back face
-RED = Colour((255, 0, 0))         # Right face
+# Standard Rubik's cube colors as IDs (ordered like the initial face mapping)
+WHITE = Colour(0)    # Up face
+GREEN = Colour(1)    # Front face
+ORANGE = Colour(2)   # Left face
+BLUE = Colour(3)     # Back face
+RED = Colour(4)      # Right face
+YELLOW = Colour(5)   # Down face
 
 # Initial face-to-color mapping for a solved cube
 # Format: (face_identifier, color)
@@ -15,13 +15,118 @@ The Cube class supports:
 This is the core data structure used throughout the Rubik's cube solver.
 """
 
-from typing import List, TypeVar, Union
+from typing import Dict, List, Tuple, Union
+from functools import lru_cache
 from itertools import permutations
 
+import numpy as np
+
 from .move import Move
 from .colour import Colour, INITIAL_FACE_COLOUR_MAPPING
-from .pieces import Corner, Edge, CORNER_TO_UFR, EDGE_TO_UF
+from .pieces import Corner, Edge, EDGE_TO_UF, CORNER_TO_UFR
 from ..scramble import parser
+from ..scramble.cleaner import merge_moves
+
+
+# Index of each face in the (6, size, size) face array
+FACE_INDEX = {"U": 0, "F": 1, "L": 2, "B": 3, "R": 4, "D": 5}
+
+
+@lru_cache(maxsize=None)
+def _face_turn_index(size: int) -> np.ndarray:
+    """
+    Gather index that turns one flattened size x size face 90 degrees clockwise.
+    
+    For a 3x3 face this is [6, 3, 0, 7, 4, 1, 8, 5, 2].
+    
+    Args:
+        size (int): Face dimension
+        
+    Returns:
+        np.ndarray: Flat index array of length size * size
+    """
+    return np.rot90(np.arange(size * size).reshape(size, size), -1).ravel()
+
+
+@lru_cache(maxsize=None)
+def _solved_faces(size: int) -> np.ndarray:
+    """
+    Face array of a solved cube, built once per size.
+    
+    The returned array is read-only; Cube.__init__ copies it.
+    
+    Args:
+        size (int): Cube dimension
+        
+    Returns:
+        np.ndarray: (6, size, size) uint8 array in FACE_INDEX order
+    """
+    colours = np.array([colour for _, colour in INITIAL_FACE_COLOUR_MAPPING], dtype=np.uint8)
+    faces = np.repeat(colours, size * size).reshape(6, size, size)
+    faces.flags.writeable = False
+
+    return faces
+
+
+# Longest move string (in characters) kept in the parse caches; longer
+# strings, such as large request bodies, are parsed on every call so the
+# caches cannot pin arbitrarily large keys and results
+MAX_CACHED_MOVES_LENGTH = 256
+
+
+def _parse_moves(scramble: str) -> Tuple[Move, ...]:
+    """
+    Parse a move string as Cube.do_moves applies it.
+    
+    Consecutive moves on the same face are merged first (see
+    cleaner.merge_moves), so "R R R" is applied as a single R'.
+    
+    Args:
+        scramble (str): Space-separated move sequence
+        
+    Returns:
+        Tuple[Move, ...]: Parsed moves
+    """
+    return tuple(merge_moves(parser.scramble_to_moves(scramble)))
+
+
+@lru_cache(maxsize=2048)
+def _parse_cached(scramble: str) -> Tuple[Move, ...]:
+    """
+    Parse a move string, remembering the result for repeated strings.
+    
+    The solver and the web API apply the same short sequences over and over
+    (e.g. "U", "D'", "R U R'"). Move objects are frozen, so the cached
+    tuples are shared between callers. Only meant for strings of at most
+    MAX_CACHED_MOVES_LENGTH characters.
+    
+    Args:
+        scramble (str): Space-separated move sequence
+        
+    Returns:
+        Tuple[Move, ...]: Parsed moves
+    """
+    return _parse_moves(scramble)
+
+
+@lru_cache(maxsize=2048)
+def _compose_cached(scramble: str, size: int) -> np.ndarray:
+    """
+    Composed sticker permutation of a move string, remembered per string.
+    
+    The returned array is read-only since it is shared between callers.
+    
+    Args:
+        scramble (str): Space-separated move sequence
+        size (int): Cube dimension
+        
+    Returns:
+        np.ndarray: Flat sticker permutation of the whole sequence
+    """
+    perm = compose_moves(scramble, size)
+    perm.flags.writeable = False
+
+    return perm
 
 
 class Cube:
@@ -33,7 +138,9 @@ class Cube:
     
     Attributes:
         size (int): Dimension of the cube (typically 3 for standard Rubik's cube)
-        faces (dict): Dictionary mapping face names to 2D color arrays
+        faces (np.ndarray): uint8 array of shape (6, size, size) holding the
+                            colour ID of every sticker, indexed by FACE_INDEX
+        flat (np.ndarray): The same stickers as one flat array (6 * size * size)
     """
     
     def __init__(self, size: int):
@@ -44,8 +151,18 @@ class Cube:
             size (int): The dimension of the cube (3 for standard cube)
         """
         self.size = size
-        self.faces = {face: self._generate_face(colour, size) 
-                      for face, colour in INITIAL_FACE_COLOUR_MAPPING}
+        self.faces = _solved_faces(size).copy()
+
+    @property
+    def flat(self) -> np.ndarray:
+        """
+        Flat view of all stickers, face after face in FACE_INDEX order.
+        """
+        return self.faces.reshape(-1)
+
+    @flat.setter
+    def flat(self, value: np.ndarray):
+        self.faces = value.reshape(6, self.size, self.size)
 
     def get_sticker(self, sticker: str) -> Colour:
         """
@@ -60,100 +177,100 @@ class Cube:
         Raises:
             ValueError: If the sticker identifier is invalid
         """
-        for perm in permutations(sticker):
-            if "".join(perm) in EDGE_TO_UF:
-                return self.get_edge("".join(perm))[sticker[0]]
-            elif "".join(perm) in CORNER_TO_UFR:
-                return self.get_corner("".join(perm))[sticker[0]]
+        if sticker not in STICKER_INDEX:
+            raise ValueError(f"Not a valid sticker: {sticker}")
 
-        raise ValueError(f"Not a valid sticker: {sticker}")
+        return self.faces.item(STICKER_INDEX[sticker])
 
     def get_edge(self, piece: str) -> Edge:
         """
         Get information about a specific edge piece.
         
+        The stickers are read straight from their positions in
+        EDGE_STICKER_MAP; the cube itself is not moved.
+        
         Args:
             piece (str): Edge piece identifier
             
         Returns:
-            Edge: Edge piece object with color information
+            Edge: Colours of the piece's stickers, in piece-name order
         """
-        moves = parser.scramble_to_moves(EDGE_TO_UF[piece])
-
-        self.do_moves(moves)
-        info = Edge({
-            piece[0]: Colour(self.faces["U"][-1][1]),
-            piece[1]: Colour(self.faces["F"][0][1])
-        })
-        parser.invert_moves(moves)
+        first, second = EDGE_STICKER_MAP[piece]
+        sticker = self.faces.item  # plain ints, which is what a Colour is
 
-        return info
+        return (sticker(first), sticker(second))
 
     def get_corner(self, piece: str) -> Corner:
         """
         Get information about a specific corner piece.
         
+        The stickers are read straight from their positions in
+        CORNER_STICKER_MAP; the cube itself is not moved.
+        
         Args:
             piece (str): Corner piece identifier
             
         Returns:
-            Corner: Corner piece object with color information
+            Corner: Colours of the piece's stickers, in piece-name order
         """
-        moves = parser.scramble_to_moves(CORNER_TO_UFR[piece])
-
-        self.do_moves(moves)
-        info = Corner({
-            piece[0]: Colour(self.faces["U"][-1][-1]), 
-            piece[1]: Colour(self.faces["F"][0][-1]),
-            piece[2]: Colour(self.faces["R"][0][0])
-        })
-        parser.invert_moves(moves)
+        first, second, third = CORNER_STICKER_MAP[piece]
+        sticker = self.faces.item  # plain ints, which is what a Colour is
 
-        return info
+        return (sticker(first), sticker(second), sticker(third))
 
     def do_moves(self, moves: Union[str, List[Move]]):
         """
         Execute a sequence of moves on the cube.
         
+        Each move is a fixed permutation of the stickers, so it is applied
+        as a single gather through the precomputed move_permutations table.
+        A move string is composed into one permutation the first time it is
+        seen, so the whole sequence is then applied in a single gather
+        (strings longer than MAX_CACHED_MOVES_LENGTH are composed on every
+        call). An empty sequence leaves the cube untouched.
+        
         Args:
             moves: Either a string in standard notation (e.g., "R U R'") 
                   or a list of Move objects
         """
+        if not moves:
+            return
+
         if isinstance(moves, str):
-            moves = parser.scramble_to_moves(moves)
+            if len(moves) <= MAX_CACHED_MOVES_LENGTH:
+                self.flat = self.flat[_compose_cached(moves, self.size)]
+            else:
+                self.flat = self.flat[compose_moves(moves, self.size)]
+            return
+
+        perms = move_permutations(self.size)
+        flat = self.flat
 
         for move in moves:
-            if move.face == "y":
-                self._y_rotate()
-            else:
-                self._rotate(move)
+            flat = flat[perms[move.face + ("2" if move.double else "'" if move.invert else "")]]
 
-    def is_solved(self) -> bool:
+        self.flat = flat
+
+    def apply_permutation(self, perm: np.ndarray):
         """
-        Check if the cube is in a solved state.
+        Apply a sticker permutation, such as one built by compose_moves.
         
-        Returns:
-            bool: True if all faces have uniform colors, False otherwise
+        Args:
+            perm (np.ndarray): Flat sticker permutation for this cube size
         """
-        for face in self.faces.values():
-            for row in face:
-                if any(piece_colour != face[0][0] for piece_colour in row):
-                    return False
-
-        return True
+        self.flat = self.flat[perm]
 
-    def _generate_face(self, colour: Colour, size: int):
+    def is_solved(self) -> bool:
         """
-        Generate a face with uniform color for cube initialization.
+        Check if the cube is in a solved state.
         
-        Args:
-            colour (Colour): The color to fill the face with
-            size (int): The dimension of the face (size x size)
-            
         Returns:
-            List[List[Colour]]: 2D array representing the face
+            bool: True if all faces have uniform colors, False otherwise
         """
-        return [[colour for _ in range(size)] for _ in range(size)]
+        return bool((self.faces == self.faces[:, :1, :1]).all())
+
+    # The methods below turn the face array directly. They are the reference
+    # implementation that move_permutations derives its tables from.
 
     def _face_rotate(self, face: str):
         """
@@ -162,7 +279,8 @@ class Cube:
         Args:
             face (str): Face identifier (F, R, U, L, B, D)
         """
-        self.faces[face] = [list(row) for row in zip(*self.faces[face][::-1])]
+        stickers = self.faces[FACE_INDEX[face]].flat
+        stickers[:] = stickers[_face_turn_index(self.size)]
 
     def _adjacent_face_swap(self, face: str):
         """
@@ -175,43 +293,36 @@ class Cube:
             face (str): The face being rotated (F, R, U, L, B, D)
         """
         if face == "U":
-            l = [self.faces[face][0] for face in ["F", "L", "B", "R"]]
-
-            self.faces["F"][0], self.faces["L"][0], \
-                self.faces["B"][0], self.faces["R"][0] = l[-1:] + l[:-1]
+            sides = [FACE_INDEX[f] for f in ["F", "L", "B", "R"]]
+            self.faces[sides, 0] = np.roll(self.faces[sides, 0], 1, axis=0)
 
         elif face == "D":
-            l = [self.faces[face][-1] for face in ["F", "L", "B", "R"]]
-
-            self.faces["F"][-1], self.faces["L"][-1], \
-                self.faces["B"][-1], self.faces["R"][-1] = l[1:] + l[:1]
+            sides = [FACE_INDEX[f] for f in ["F", "L", "B", "R"]]
+            self.faces[sides, -1] = np.roll(self.faces[sides, -1], -1, axis=0)
 
         elif face == "F":
-            l = [self.faces["U"], _transpose(self.faces["R"]),
-                 self.faces["D"], _transpose(self.faces["L"])]
-            r = [l[0][-1], l[1][0][::-1], l[2][0], l[3][-1][::-1]]
-
-            l[0][-1], l[1][0], l[2][0], l[3][-1] = r[-1:] + r[:-1]
+            u, r, d, l = (self.faces[FACE_INDEX[f]] for f in ["U", "R", "D", "L"])
+            u_row = u[-1].copy()
 
-            self.faces["U"][-1] = l[0][-1]
-            self.faces["R"] = _transpose(l[1])
-            self.faces["D"][0] = l[2][0]
-            self.faces["L"] = _transpose(l[3])
+            u[-1] = l[::-1, -1]
+            l[:, -1] = d[0]
+            d[0] = r[::-1, 0]
+            r[:, 0] = u_row
 
         elif face == "R":
-            self._y_rotate()
+            self._y_rotate(1)
             self._adjacent_face_swap("F")
-            self._y_rotate(inverse=True)
+            self._y_rotate(3)
 
         elif face == "L":
-            self._y_rotate(inverse=True)
+            self._y_rotate(3)
             self._adjacent_face_swap("F")
-            self._y_rotate()
+            self._y_rotate(1)
 
         elif face == "B":
-            self._y_rotate(double=True)
+            self._y_rotate(2)
             self._adjacent_face_swap("F")
-            self._y_rotate(double=True)
+            self._y_rotate(2)
             
     def _rotate(self, move: Move):
         """
@@ -224,34 +335,125 @@ class Cube:
             self._face_rotate(move.face)
             self._adjacent_face_swap(move.face)
 
-    def _y_rotate(self, double=False, inverse=False):
+    def _y_rotate(self, k: int = 1):
         """
         Perform a cube rotation around the Y-axis.
         
         This rotates the entire cube, changing which faces are front/back/left/right.
+        The side faces are cycled and U/D turned once for the whole rotation,
+        whatever the number of quarter turns.
         
         Args:
-            double (bool): If True, rotate 180 degrees
-            inverse (bool): If True, rotate counter-clockwise
+            k (int): Number of clockwise quarter turns (1 = y, 2 = y2, 3 = y')
         """
-        for i in range(2 if double else 3 if inverse else 1):
-            l = [self.faces[face] for face in ["F", "L", "B", "R"]]
-            self.faces["F"], self.faces["L"], self.faces["B"], self.faces["R"] = l[-1:] + l[:-1]
+        sides = [FACE_INDEX[face] for face in ["F", "L", "B", "R"]]
+        self.faces[sides] = np.roll(self.faces[sides], k, axis=0)
 
-            self._face_rotate("U")
-            for _ in range(3):
-                self._face_rotate("D")
+        self.faces[FACE_INDEX["U"]] = np.rot90(self.faces[FACE_INDEX["U"]], -k)
+        self.faces[FACE_INDEX["D"]] = np.rot90(self.faces[FACE_INDEX["D"]], k)
+
+
+@lru_cache(maxsize=None)
+def move_permutations(size: int) -> Dict[str, np.ndarray]:
+    """
+    Build the sticker permutation of every move for a cube of the given size.
+    
+    Each move is run once through the reference face-turning code on a cube
+    whose stickers hold their own flat index. The resulting flat array is the
+    permutation `p` such that `flat[p]` is the state after the move.
     
+    The returned arrays are read-only since they are shared between callers.
+    
+    Args:
+        size (int): Cube dimension
+        
+    Returns:
+        Dict[str, np.ndarray]: Move name (e.g. "R", "U'", "y2") to permutation
+    """
+    perms = {}
+
+    for face in ["U", "D", "F", "R", "L", "B", "y"]:
+        for suffix, invert, double in [("", False, False), ("'", True, False), ("2", False, True)]:
+            cube = Cube(size)
+            cube.faces = np.arange(6 * size * size).reshape(6, size, size)
+
+            if face == "y":
+                cube._y_rotate(2 if double else 3 if invert else 1)
+            else:
+                cube._rotate(Move(face, invert, double))
+
+            perm = cube.flat.copy()
+            perm.flags.writeable = False
+            perms[face + suffix] = perm
+
+    return perms
+
+
+def compose_moves(moves: Union[str, List[Move]], size: int = 3) -> np.ndarray:
+    """
+    Fuse a move sequence into a single sticker permutation.
+    
+    Applying the result with Cube.apply_permutation gives the same state as
+    running the whole sequence through do_moves, in one gather.
+    
+    Args:
+        moves: Either a string in standard notation or a list of Move objects
+        size (int): Cube dimension the permutation is built for
+        
+    Returns:
+        np.ndarray: Composed flat sticker permutation
+    """
+    if isinstance(moves, str):
+        if len(moves) <= MAX_CACHED_MOVES_LENGTH:
+            moves = _parse_cached(moves)
+        else:
+            moves = _parse_moves(moves)
+
+    perms = move_permutations(size)
+    acc = np.arange(6 * size * size)
+
+    for move in moves:
+        acc = acc[perms[move.face + ("2" if move.double else "'" if move.invert else "")]]
+
+    return acc
+
 
-T = TypeVar("T")
-def _transpose(l: List[List[T]]) -> List[List[T]]:
+def _home_indices(setup: str, targets: Tuple[int, ...]) -> Tuple[int, ...]:
     """
-    Transpose a 2D matrix (swap rows and columns).
+    Find where the stickers seen at `targets` after a setup sequence start from.
     
     Args:
-        l: 2D list to transpose
+        setup (str): Move sequence bringing a piece to the reference position
+        targets: Flat sticker indices read at the reference position
         
     Returns:
-        List[List[T]]: Transposed matrix
+        Tuple of flat sticker indices, one per target
     """
-    return [list(i) for i in zip(*l)]
+    perm = compose_moves(setup)
+
+    return tuple(int(perm[target]) for target in targets)
+
+
+# Flat indices of the UF (U then F) and UFR (U, F then R) stickers
+UF_INDICES = (FACE_INDEX["U"] * 9 + 7, FACE_INDEX["F"] * 9 + 1)
+UFR_INDICES = (FACE_INDEX["U"] * 9 + 8, FACE_INDEX["F"] * 9 + 2, FACE_INDEX["R"] * 9)
+
+# Flat sticker indices of each piece's stickers (see Cube.flat), in
+# piece-name order. Derived from the EDGE_TO_UF / CORNER_TO_UFR setup
+# sequences at import time, so reading a piece needs no moves.
+EDGE_STICKER_MAP = {
+    piece: _home_indices(setup, UF_INDICES)
+    for piece, setup in EDGE_TO_UF.items()
+}
+CORNER_STICKER_MAP = {
+    piece: _home_indices(setup, UFR_INDICES)
+    for piece, setup in CORNER_TO_UFR.items()
+}
+
+# Flat index of every sticker by name, in any face order (e.g. "FUR" is the
+# F sticker of the UFR corner), matching what get_sticker reads
+STICKER_INDEX = {
+    "".join(name): indices[piece.index(name[0])]
+    for piece, indices in {**EDGE_STICKER_MAP, **CORNER_STICKER_MAP}.items()
+    for name in permutations(piece)
+}
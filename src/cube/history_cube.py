@@ -16,13 +16,29 @@ This class provides the same cube functionality as the base Cube class
 while transparently recording all move operations.
 """
 
-from typing import List, Dict, Union
+from functools import lru_cache
+from typing import List, Union
 
-from .cube import Cube
-from .pieces import Corner, Edge, EDGE_TO_UF, CORNER_TO_UFR
-from .move import Move
-from .colour import Colour
-from ..scramble import parser
+import numpy as np
+
+from .cube import Cube, MAX_CACHED_MOVES_LENGTH, _parse_cached, _parse_moves
+from .move import Move, PackedMoves, encode_moves
+
+
+@lru_cache(maxsize=2048)
+def _encode_cached(scramble: str) -> bytes:
+    """
+    Move codes of a move string, parsed as Cube.do_moves parses it.
+    
+    Only meant for strings of at most MAX_CACHED_MOVES_LENGTH characters.
+    
+    Args:
+        scramble (str): Space-separated move sequence
+        
+    Returns:
+        bytes: One move code per parsed move
+    """
+    return encode_moves(_parse_cached(scramble))
 
 
 class HistoryCube(Cube):
@@ -34,90 +50,38 @@ class HistoryCube(Cube):
     and step-by-step solving functionality.
     
     Attributes:
-        _history (List[Move]): Complete sequence of moves executed
+        _history (bytearray): Complete sequence of moves executed, one
+                              move code per byte (see move.MOVE_CODES)
         
     All cube operations are identical to the base Cube class, with
     the addition of automatic move history recording.
     """
     
-    def __init__(self, size: int, faces: Dict[str, List[List[Colour]]]=None):
+    def __init__(self, size: int, faces: np.ndarray=None):
         """
         Initialize a HistoryCube with optional predefined face configuration.
         
         Args:
             size (int): Cube dimension (typically 3 for standard cube)
-            faces (Dict, optional): Predefined face configuration,
+            faces (np.ndarray, optional): Predefined face configuration,
                                    defaults to solved state if None
         """
         super().__init__(size)
         
         # Use provided faces or default to solved state
-        self.faces = faces if faces else self.faces
+        self.faces = faces if faces is not None else self.faces
         
         # Initialize empty move history
-        self._history = []
+        self._history = bytearray()
 
-    def get_move_history(self) -> List[Move]:
+    def get_move_history(self) -> PackedMoves:
         """
         Retrieve the complete move history.
         
         Returns:
-            List[Move]: Chronological sequence of all moves executed
+            PackedMoves: Live chronological sequence of all moves executed
         """
-        return self._history
-
-    def get_edge(self, piece: str) -> Edge:
-        """
-        Get edge piece information without affecting move history.
-        
-        Overrides parent method to temporarily disable history tracking
-        during piece analysis operations.
-        
-        Args:
-            piece (str): Edge piece identifier
-            
-        Returns:
-            Edge: Edge piece information with colors
-        """
-        moves = parser.scramble_to_moves(EDGE_TO_UF[piece])
-
-        # Execute setup moves without recording to history
-        self.do_moves(moves, False)
-        info = Edge({
-            piece[0]: Colour(self.faces["U"][-1][1]),
-            piece[1]: Colour(self.faces["F"][0][1])
-        })
-        # Undo setup moves without recording to history
-        self.do_moves(parser.invert_moves(moves), False)
-
-        return info
-
-    def get_corner(self, piece: str) -> Corner:
-        """
-        Get corner piece information without affecting move history.
-        
-        Overrides parent method to temporarily disable history tracking
-        during piece analysis operations.
-        
-        Args:
-            piece (str): Corner piece identifier
-            
-        Returns:
-            Corner: Corner piece information with colors
-        """
-        moves = parser.scramble_to_moves(CORNER_TO_UFR[piece])
-
-        # Execute setup moves without recording to history
-        self.do_moves(moves, False)
-        info = Corner({
-            piece[0]: Colour(self.faces["U"][-1][-1]), 
-            piece[1]: Colour(self.faces["F"][0][-1]),
-            piece[2]: Colour(self.faces["R"][0][0])
-        })
-        # Undo setup moves without recording to history
-        self.do_moves(parser.invert_moves(moves), False)
-
-        return info
+        return PackedMoves(self._history)
 
     def do_moves(self, moves: Union[str, List[Move]], save_history: bool=True):
         """
@@ -125,6 +89,9 @@ class HistoryCube(Cube):
         
         Extends the parent do_moves method to include history recording.
         Allows temporary disabling of history tracking for internal operations.
+        A move string is recorded through cached move codes (uncached past
+        MAX_CACHED_MOVES_LENGTH), parsed as Cube.do_moves parses it (so
+        same-face runs are already merged).
         
         Args:
             moves: Move sequence to execute (string or Move list)
@@ -134,11 +101,12 @@ class HistoryCube(Cube):
         # Execute the moves using parent implementation
         super().do_moves(moves)
 
-        # Convert string notation to Move objects if needed
-        if isinstance(moves, str):
-            moves = parser.scramble_to_moves(moves)
-
         # Record moves to history if requested
         if save_history:
-            for move in moves:
-                self._history.append(move)
+            if isinstance(moves, str):
+                if len(moves) <= MAX_CACHED_MOVES_LENGTH:
+                    self._history += _encode_cached(moves)
+                else:
+                    self._history += encode_moves(_parse_moves(moves))
+            else:
+                self._history += encode_moves(moves)
@@ -9,13 +9,15 @@ Move notation:
 - F', R', U', L', B', D': Counter-clockwise (inverse) rotations  
 - F2, R2, U2, L2, B2, D2: 180-degree (double) rotations
 
-The Move class encapsulates these variations in a simple data structure.
+The Move class encapsulates these variations in a small immutable record.
 """
 
+from collections.abc import Sequence
 from dataclasses import dataclass
+from typing import Iterable, Union
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Move:
     """
     Represents a single move operation on a Rubik's cube.
@@ -29,7 +31,77 @@ class Move:
         Move("R", False, False) -> R (90° clockwise)
         Move("U", True, False) -> U' (90° counter-clockwise) 
         Move("F", False, True) -> F2 (180°)
+    
+    Moves are frozen and slotted: they carry no per-instance __dict__, can
+    be hashed, and can be shared safely between move lists.
     """
     face: str
     invert: bool
-    double: bool
\ No newline at end of file
+    double: bool
+
+
+# Faces in move-code order (y is the whole-cube rotation)
+MOVE_FACES = "FBLRUDy"
+
+# Every Move by its single-byte code: face index << 2 | double << 1 | invert
+MOVES_BY_CODE = tuple(Move(face, bool(code & 1), bool(code & 2))
+                      for face in MOVE_FACES for code in range(4))
+MOVE_CODES = {move: code for code, move in enumerate(MOVES_BY_CODE)}
+
+
+def encode_moves(moves: Iterable[Move]) -> bytes:
+    """
+    Encode a move sequence as one byte per move (see MOVE_CODES).
+    
+    Args:
+        moves (Iterable[Move]): Moves to encode
+        
+    Returns:
+        bytes: Move codes, in order
+    """
+    return bytes(MOVE_CODES[move] for move in moves)
+
+
+# Byte translation table flipping the invert bit of every move code
+INVERT_CODES = bytes(code ^ 1 for code in range(256))
+
+
+class PackedMoves(Sequence):
+    """
+    Read-only move sequence stored as one move code per byte.
+    
+    Moves are decoded to the shared MOVES_BY_CODE instances on access.
+    Wrapping a bytearray gives a live view that reflects later appends
+    (as HistoryCube does for its history).
+    """
+    
+    def __init__(self, codes: Union[bytes, bytearray]):
+        self.codes = codes
+
+    def __len__(self) -> int:
+        return len(self.codes)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return PackedMoves(bytes(self.codes[index]))
+        return MOVES_BY_CODE[self.codes[index]]
+
+    def __iter__(self):
+        return map(MOVES_BY_CODE.__getitem__, self.codes)
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, PackedMoves):
+            return self.codes == other.codes
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"PackedMoves({list(self)!r})"
+
+    def inverted(self) -> "PackedMoves":
+        """
+        The sequence undoing this one: reversed, with every invert bit flipped.
+        
+        Returns:
+            PackedMoves: Inverse move sequence
+        """
+        return PackedMoves(self.codes[::-1].translate(INVERT_CODES))
@@ -10,22 +10,25 @@ The mapping sequences move each piece to a standard position:
 - All edges are moved to the UF (Up-Front) position
 - All corners are moved to the UFR (Up-Front-Right) position
 
-This standardization allows for consistent piece analysis and solving algorithms.
+The cube module replays these sequences once at import time to find which
+stickers each piece is read from (see cube.EDGE_STICKER_MAP and
+cube.CORNER_STICKER_MAP), so pieces are read in place without moving the cube.
 """
 
-from typing import NewType, Dict, Literal
+from typing import Tuple
 from .colour import Colour
 
 
-# Type definitions for cube pieces
-Corner = NewType("Corner", Dict[str, Colour])
-Edge = NewType("Edge", Dict[str, Colour])
+# Type definitions for cube pieces: sticker colours in piece-name order
+# (e.g. for "UFR": the U, F and R stickers)
+Corner = Tuple[Colour, Colour, Colour]
+Edge = Tuple[Colour, Colour]
 
 
 # Move sequences to bring each edge piece to the UF (Up-Front) position
 # Format: "piece_position": "move_sequence"
 EDGE_TO_UF = {
-    "UF": "U2 U2",     # Already in position (no-op moves)
+    "UF": "",          # Already in position
     "UL": "U'",        # Up-Left to Up-Front
     "UR": "U",         # Up-Right to Up-Front  
     "UB": "U2",        # Up-Back to Up-Front
@@ -43,7 +46,7 @@ EDGE_TO_UF = {
 # Move sequences to bring each corner piece to the UFR (Up-Front-Right) position
 # Format: "piece_position": "move_sequence"  
 CORNER_TO_UFR = {
-    "UFR": "U2 U2",    # Already in position (no-op moves)
+    "UFR": "",         # Already in position
     "DFR": "R",        # Down-Front-Right to Up-Front-Right
     "DBR": "R2",       # Down-Back-Right to Up-Front-Right
     "URB": "U",        # Up-Right-Back to Up-Front-Right
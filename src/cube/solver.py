@@ -13,113 +13,233 @@ solving methods, breaking down the solution into these sequential steps:
 6. CPLL (Corner Permutation Last Layer): Position last layer corners
 7. EPLL (Edge Permutation Last Layer): Position last layer edges
 
-The solver provides detailed step-by-step output and returns a complete
-move sequence that can be executed to solve any valid cube configuration.
+The solver returns a complete move sequence that can be executed to solve
+any valid cube configuration, and can print detailed step-by-step output
+(generate_solution(cube, verbose=True)).
 """
 
 from typing import List
-from copy import deepcopy
 
-from .cube import Cube
+import numpy as np
+
+from .cube import Cube, STICKER_INDEX, compose_moves
 from .move import Move
-from .colour import WHITE, YELLOW, GREEN, BLUE, ORANGE, RED
+from .colour import Colour, WHITE, YELLOW, GREEN, BLUE, ORANGE, RED
 from .history_cube import HistoryCube
-from ..scramble.cleaner import clean_moves
-from ..scramble.parser import scramble_to_moves, moves_to_scramble
-
-
-def generate_solution(cube: Cube) -> List[Move]:
+from ..scramble.cleaner import merge_moves
+from ..scramble.parser import moves_to_scramble
+
+
+# U-layer alignments tried by the last-layer steps, by clockwise quarter turns
+U_TURNS = ["", "U", "U2", "U'"]
+U_TURN_PERMS = [compose_moves(turn).tolist() for turn in U_TURNS]
+
+# Setup moves bringing each edge to UF for cross solving
+CROSS_EDGES = {
+    "UF": "",           # Already in correct position
+    "UL": "U'",         # Move from Up-Left to Down-Front
+    "UR": "U",          # Move from Up-Right to Down-Front
+    "UB": "U2",         # Move from Up-Back to Down-Front
+    "LB": "L U' L'",    # Extract from Left-Back
+    "LD": "L2 U'",      # Extract from Left-Down
+    "LF": "L' U' L",    # Extract from Left-Front
+    "RB": "R' U R",     # Extract from Right-Back
+    "RD": "R2 U",       # Extract from Right-Down
+    "RF": "R U R'",
+    "DB": "B2 U2",
+    "DF": "F2"
+}
+
+# Setup moves bringing each corner to UFR for the first layer
+FIRST_LAYER_CORNERS = {
+    "UFR": "",
+    "DFR": "R U R' U'",
+    "DBR": "R' U R U",
+    "URB": "U",
+    "ULF": "U'",
+    "UBL": "U2",
+    "DFL": "L' U' L",
+    "DBL": "L U L' U"
+}
+
+# Setup moves bringing each edge to UF for the middle layer
+MIDDLE_EDGES = {
+    "UF": "",
+    "UR": "U",
+    "UL": "U'",
+    "UB": "U2",
+    "RF": "R' F R F' R U R' U'",
+    "LF": "L F' L' F L' U' L U",
+    "RB": "R' U R B' R B R'",
+    "LB": "L U' L' B L' B' L"
+}
+
+# Corner orientation algorithms of the last layer, by case name
+OCLLS = {
+    "S": "R U R' U R U2 R' U",
+    "AS": "U R' U' R U' R' U2 R",
+    "H": "F R U R' U' R U R' U' R U R' U' F'",
+    "Headlights": "R2 D' R U2 R' D R U2 R",
+    "Sidebars": "U' L F R' F' L' F R F'",
+    "Fish": "R' U2 R' D' R U2 R' D R2",
+    "Pi": "U R U2 R2 U' R2 U' R2 U2 R"
+}
+
+# Corner swap of the last layer (CPLL)
+CPLL_ALG = "R' U L' U2 R U' R' U2 R L"
+
+# Edge 3-cycle of the last layer (EPLL)
+EPLL_ALG = "R U' R U R U R U' R' U' R2"
+
+
+def generate_solution(cube: Cube, verbose: bool = False) -> List[Move]:
     """
     Generate a complete LBL solution for the given cube state.
     
     This function implements the Layer-by-Layer method to solve a Rubik's cube,
-    providing detailed progress tracking and move counting for each step.
+    optionally reporting progress and move counts for each step.
     
     Args:
         cube (Cube): The cube state to solve
+        verbose (bool): Whether to print progress while solving
+                        (default: False)
         
     Returns:
         List[Move]: Sequence of moves that will solve the cube
         
-    The function prints detailed progress information including:
+    When verbose, the function prints detailed progress information including:
     - Move count for each solving step
     - Individual step solutions
     - Total move count and breakdown
     """
-    print("\n=== Layer-by-Layer (LBL) Solution Generation ===")
-    cube_copy = HistoryCube(cube.size, deepcopy(cube.faces))
-
-    print("Step 1: Solving Cross (White Cross on Bottom)...")
-    initial_moves = len(cube_copy.get_move_history())
+    if verbose:
+        print("\n=== Layer-by-Layer (LBL) Solution Generation ===")
+    cube_copy = HistoryCube(cube.size, cube.faces.copy())
+    history = cube_copy.get_move_history()  # live view, grows as moves are made
+
+    if verbose:
+        print("Step 1: Solving Cross (White Cross on Bottom)...")
+        initial_moves = len(history)
     solve_cross(cube_copy)
-    cross_moves = len(cube_copy.get_move_history()) - initial_moves
-    print(f"Cross solved in {cross_moves} moves")
-    if cross_moves > 0:
-        cross_solution = cube_copy.get_move_history()[initial_moves:]
-        print(f"Cross moves: {moves_to_scramble(cross_solution)}")
-    
-    print("\nStep 2: Solving First Layer Corners...")
-    corners_start = len(cube_copy.get_move_history())
+    if verbose:
+        cross_moves = len(history) - initial_moves
+        print(f"Cross solved in {cross_moves} moves")
+        if cross_moves > 0:
+            cross_solution = history[initial_moves:]
+            print(f"Cross moves: {moves_to_scramble(cross_solution)}")
+
+    if verbose:
+        print("\nStep 2: Solving First Layer Corners...")
+        corners_start = len(history)
     solve_corners(cube_copy)
-    corners_moves = len(cube_copy.get_move_history()) - corners_start
-    print(f"First layer corners solved in {corners_moves} moves")
-    if corners_moves > 0:
-        corners_solution = cube_copy.get_move_history()[corners_start:]
-        print(f"Corners moves: {moves_to_scramble(corners_solution)}")
-    
-    print("\nStep 3: Solving Middle Layer Edges...")
-    middle_start = len(cube_copy.get_move_history())
+    if verbose:
+        corners_moves = len(history) - corners_start
+        print(f"First layer corners solved in {corners_moves} moves")
+        if corners_moves > 0:
+            corners_solution = history[corners_start:]
+            print(f"Corners moves: {moves_to_scramble(corners_solution)}")
+
+    if verbose:
+        print("\nStep 3: Solving Middle Layer Edges...")
+        middle_start = len(history)
     solve_middle_edges(cube_copy)
-    middle_moves = len(cube_copy.get_move_history()) - middle_start
-    print(f"Middle layer solved in {middle_moves} moves")
-    if middle_moves > 0:
-        middle_solution = cube_copy.get_move_history()[middle_start:]
-        print(f"Middle layer moves: {moves_to_scramble(middle_solution)}")
-    
-    print("\nStep 4: Solving EOLL (Edge Orientation of Last Layer)...")
-    eoll_start = len(cube_copy.get_move_history())
+    if verbose:
+        middle_moves = len(history) - middle_start
+        print(f"Middle layer solved in {middle_moves} moves")
+        if middle_moves > 0:
+            middle_solution = history[middle_start:]
+            print(f"Middle layer moves: {moves_to_scramble(middle_solution)}")
+
+    if verbose:
+        print("\nStep 4: Solving EOLL (Edge Orientation of Last Layer)...")
+        eoll_start = len(history)
     solve_eoll(cube_copy)
-    eoll_moves = len(cube_copy.get_move_history()) - eoll_start
-    print(f"EOLL solved in {eoll_moves} moves")
-    if eoll_moves > 0:
-        eoll_solution = cube_copy.get_move_history()[eoll_start:]
-        print(f"EOLL moves: {moves_to_scramble(eoll_solution)}")
-    
-    print("\nStep 5: Solving OCLL (Orientation of Corners of Last Layer)...")
-    ocll_start = len(cube_copy.get_move_history())
+    if verbose:
+        eoll_moves = len(history) - eoll_start
+        print(f"EOLL solved in {eoll_moves} moves")
+        if eoll_moves > 0:
+            eoll_solution = history[eoll_start:]
+            print(f"EOLL moves: {moves_to_scramble(eoll_solution)}")
+
+    if verbose:
+        print("\nStep 5: Solving OCLL (Orientation of Corners of Last Layer)...")
+        ocll_start = len(history)
     solve_ocll(cube_copy)
-    ocll_moves = len(cube_copy.get_move_history()) - ocll_start
-    print(f"OCLL solved in {ocll_moves} moves")
-    if ocll_moves > 0:
-        ocll_solution = cube_copy.get_move_history()[ocll_start:]
-        print(f"OCLL moves: {moves_to_scramble(ocll_solution)}")
-    
-    print("\nStep 6: Solving CPLL (Corner Permutation of Last Layer)...")
-    cpll_start = len(cube_copy.get_move_history())
+    if verbose:
+        ocll_moves = len(history) - ocll_start
+        print(f"OCLL solved in {ocll_moves} moves")
+        if ocll_moves > 0:
+            ocll_solution = history[ocll_start:]
+            print(f"OCLL moves: {moves_to_scramble(ocll_solution)}")
+
+    if verbose:
+        print("\nStep 6: Solving CPLL (Corner Permutation of Last Layer)...")
+        cpll_start = len(history)
     solve_cpll(cube_copy)
-    cpll_moves = len(cube_copy.get_move_history()) - cpll_start
-    print(f"CPLL solved in {cpll_moves} moves")
-    if cpll_moves > 0:
-        cpll_solution = cube_copy.get_move_history()[cpll_start:]
-        print(f"CPLL moves: {moves_to_scramble(cpll_solution)}")
-    
-    print("\nStep 7: Solving EPLL (Edge Permutation of Last Layer)...")
-    epll_start = len(cube_copy.get_move_history())
+    if verbose:
+        cpll_moves = len(history) - cpll_start
+        print(f"CPLL solved in {cpll_moves} moves")
+        if cpll_moves > 0:
+            cpll_solution = history[cpll_start:]
+            print(f"CPLL moves: {moves_to_scramble(cpll_solution)}")
+
+    if verbose:
+        print("\nStep 7: Solving EPLL (Edge Permutation of Last Layer)...")
+        epll_start = len(history)
     solve_epll(cube_copy)
-    epll_moves = len(cube_copy.get_move_history()) - epll_start
-    print(f"EPLL solved in {epll_moves} moves")
-    if epll_moves > 0:
-        epll_solution = cube_copy.get_move_history()[epll_start:]
-        print(f"EPLL moves: {moves_to_scramble(epll_solution)}")
+    if verbose:
+        epll_moves = len(history) - epll_start
+        print(f"EPLL solved in {epll_moves} moves")
+        if epll_moves > 0:
+            epll_solution = history[epll_start:]
+            print(f"EPLL moves: {moves_to_scramble(epll_solution)}")
+
+    if verbose:
+        total_moves = len(history)
+        print(f"\n=== LBL Solution Complete! ===")
+        print(f"Total moves: {total_moves}")
+        print(f"Breakdown: Cross({cross_moves}) + Corners({corners_moves}) + Middle({middle_moves}) + EOLL({eoll_moves}) + OCLL({ocll_moves}) + CPLL({cpll_moves}) + EPLL({epll_moves})")
+        print(f"Full solution: {moves_to_scramble(history)}")
+        print("=" * 50)
+
+    return merge_moves(history)
+
+
+def solve_state(state: bytes, size: int) -> List[Move]:
+    """
+    Solve a cube given as raw sticker bytes.
     
-    total_moves = len(cube_copy.get_move_history())
-    print(f"\n=== LBL Solution Complete! ===")
-    print(f"Total moves: {total_moves}")
-    print(f"Breakdown: Cross({cross_moves}) + Corners({corners_moves}) + Middle({middle_moves}) + EOLL({eoll_moves}) + OCLL({ocll_moves}) + CPLL({cpll_moves}) + EPLL({epll_moves})")
-    print(f"Full solution: {moves_to_scramble(cube_copy.get_move_history())}")
-    print("=" * 50)
+    This is the entry point of the web app's solver worker processes: the
+    state pickles as plain bytes, and a worker only needs this module
+    (not the Flask app) to run it.
+    
+    Args:
+        state (bytes): Flat uint8 sticker state, as from cube.flat.tobytes()
+        size (int): Cube dimension
+        
+    Returns:
+        List[Move]: Sequence of moves that will solve the cube
+    """
+    cube = Cube(size)
+    cube.flat = np.frombuffer(state, dtype=np.uint8).copy()
+
+    return generate_solution(cube)
+
 
-    return scramble_to_moves(clean_moves(moves_to_scramble(cube_copy.get_move_history())))
+def stickers_after_u(cube: Cube, stickers: List[str], turns: int) -> List[Colour]:
+    """
+    Read stickers as they would be after turning U, without turning it.
+    
+    Args:
+        cube (Cube): The cube to read
+        stickers (List[str]): Sticker names, as accepted by get_sticker
+        turns (int): Clockwise quarter turns of U (taken mod 4)
+        
+    Returns:
+        List[Colour]: The colour each sticker would show
+    """
+    perm = U_TURN_PERMS[turns % 4]
+    return [cube.faces.item(perm[STICKER_INDEX[sticker]]) for sticker in stickers]
 
 
 def solve_cross(cube: HistoryCube):
@@ -132,30 +252,15 @@ def solve_cross(cube: HistoryCube):
     Args:
         cube (HistoryCube): The cube to solve (modified in place)
     """
-    # Edge position mapping for cross solving
-    EDGES = {
-        "UF": "",           # Already in correct position
-        "UL": "U'",         # Move from Up-Left to Down-Front
-        "UR": "U",          # Move from Up-Right to Down-Front
-        "UB": "U2",         # Move from Up-Back to Down-Front
-        "LB": "L U' L'",    # Extract from Left-Back
-        "LD": "L2 U'",      # Extract from Left-Down
-        "LF": "L' U' L",    # Extract from Left-Front
-        "RB": "R' U R",     # Extract from Right-Back
-        "RD": "R2 U",       # Extract from Right-Down
-        "RF": "R U R'",
-        "DB": "B2 U2",
-        "DF": "F2"
-    }
 
     for colour in [BLUE, ORANGE, GREEN, RED]:
-        for edge in EDGES:
-            cur_edge = tuple(cube.get_edge(edge).values())
+        for edge in CROSS_EDGES:
+            cur_edge = cube.get_edge(edge)
 
             if cur_edge in [(colour, YELLOW), (YELLOW, colour)]:
-                cube.do_moves(EDGES[edge])
+                cube.do_moves(CROSS_EDGES[edge])
 
-                if cube.get_edge("UF")["U"] == YELLOW:
+                if cube.get_edge("UF")[0] == YELLOW:
                     cube.do_moves("F2")
                 else:
                     cube.do_moves("R U' R' F")
@@ -168,24 +273,14 @@ def solve_cross(cube: HistoryCube):
 
 
 def solve_corners(cube: Cube):
-    CORNERS = {
-        "UFR": "U2 U2",
-        "DFR": "R U R' U'",
-        "DBR": "R' U R U",
-        "URB": "U",
-        "ULF": "U'",
-        "UBL": "U2",
-        "DFL": "L' U' L",
-        "DBL": "L U L' U" 
-    }
 
     for colour1, colour2 in [(GREEN, RED), (BLUE, RED), 
                              (BLUE, ORANGE), (GREEN, ORANGE)]:
-        for corner in CORNERS:
-            cur_corner = cube.get_corner(corner).values()
+        for corner in FIRST_LAYER_CORNERS:
+            cur_corner = cube.get_corner(corner)
 
             if colour1 in cur_corner and colour2 in cur_corner and YELLOW in cur_corner:
-                cube.do_moves(CORNERS[corner])
+                cube.do_moves(FIRST_LAYER_CORNERS[corner])
 
                 if cube.get_sticker("UFR") == YELLOW:
                     moves = "U R U2 R' U R U' R'"
@@ -201,23 +296,13 @@ def solve_corners(cube: Cube):
     
 
 def solve_middle_edges(cube: Cube):
-    EDGES = {
-        "UF": "U2 U2",
-        "UR": "U",
-        "UL": "U'",
-        "UB": "U2",
-        "RF": "R' F R F' R U R' U'",
-        "LF": "L F' L' F L' U' L U",
-        "RB": "R' U R B' R B R'",
-        "LB": "L U' L' B L' B' L"
-    }
 
     for colour1, colour2 in [(GREEN, RED), (RED, BLUE), (BLUE, ORANGE), (ORANGE, GREEN)]:
-        for edge in EDGES:
-            cur_edge = tuple(cube.get_edge(edge).values())
+        for edge in MIDDLE_EDGES:
+            cur_edge = cube.get_edge(edge)
 
             if cur_edge == (colour1, colour2) or cur_edge == (colour2, colour1):
-                cube.do_moves(EDGES[edge])
+                cube.do_moves(MIDDLE_EDGES[edge])
 
                 if cube.get_sticker("FU") == colour1:
                     moves = "U R U' R' F R' F' R"
@@ -230,109 +315,100 @@ def solve_middle_edges(cube: Cube):
 
 
 def solve_eoll(cube: Cube):
-    for _ in range(4):
-        top_layer = [cube.get_sticker("UB"), cube.get_sticker("UR"),
-                     cube.get_sticker("UF"), cube.get_sticker("UL")]
+    for turns in range(4):
+        top_layer = stickers_after_u(cube, ["UB", "UR", "UF", "UL"], turns)
         eo_state = [face == WHITE for face in top_layer]
 
         if eo_state == [False, False, False, False]:
-            cube.do_moves("R U2 R2 F R F' U2 R' F R F'")
+            cube.do_moves(U_TURNS[turns] + " R U2 R2 F R F' U2 R' F R F'")
             break
         elif eo_state == [False, False, True, True]:
-            cube.do_moves("U F U R U' R' F''")
+            cube.do_moves(U_TURNS[turns] + " U F U R U' R' F'")
             break
         elif eo_state == [False, True, False, True]:
-            cube.do_moves("F R U R' U' F'")
+            cube.do_moves(U_TURNS[turns] + " F R U R' U' F'")
             break
-        else:
-            cube.do_moves("U")
 
 
 def solve_ocll(cube: Cube):
-    OCLLS = {
-        "S": "R U R' U R U2 R' U",
-        "AS": "U R' U' R U' R' U2 R",
-        "H": "F R U R' U' R U R' U' R U R' U' F'",
-        "Headlights": "R2 D' R U2 R' D R U2 R",
-        "Sidebars": "U' L F R' F' L' F R F'",
-        "Fish": "R' U2 R' D' R U2 R' D R2",
-        "Pi": "U R U2 R2 U' R2 U' R2 U2 R"
-    }
-
-    def get_top_layer_corners(cube: Cube):
-        return [cube.get_sticker("UBL"), cube.get_sticker("UBR"),
-                cube.get_sticker("UFR"), cube.get_sticker("UFL")]
-
     def get_co_state(top_layer):
         return [face == WHITE for face in top_layer]
 
-    for _ in range(4):
-        co_state = get_co_state(get_top_layer_corners(cube))
+    for turns in range(4):
+        co_state = get_co_state(stickers_after_u(cube, ["UBL", "UBR", "UFR", "UFL"], turns))
 
         if co_state == [False, False, False, False]:
-            while cube.get_sticker("FUR") != WHITE or cube.get_sticker("FUL") != WHITE:
-                cube.do_moves("U")
+            while stickers_after_u(cube, ["FUR", "FUL"], turns) != [WHITE, WHITE]:
+                turns += 1
+
+            front, back = stickers_after_u(cube, ["FUR", "BUL"], turns)
 
-            if cube.get_corner("UFR")["F"] == cube.get_corner("UBL")["B"]: 
-                cube.do_moves(OCLLS["H"])
+            if front == back:
+                alg = OCLLS["H"]
             else:
-                cube.do_moves(OCLLS["Pi"])
-            break
+                alg = OCLLS["Pi"]
         elif co_state == [False, False, False, True]:
-            if cube.get_sticker("FUR") == WHITE:
-                cube.do_moves(OCLLS["S"])
+            if stickers_after_u(cube, ["FUR"], turns)[0] == WHITE:
+                alg = OCLLS["S"]
             else:
-                cube.do_moves(OCLLS["AS"])
-            break
+                alg = OCLLS["AS"]
         elif co_state == [False, False, True, True]:
-            if cube.get_sticker("BRU") == WHITE:
-                cube.do_moves(OCLLS["Headlights"])
+            if stickers_after_u(cube, ["BRU"], turns)[0] == WHITE:
+                alg = OCLLS["Headlights"]
             else:
-                cube.do_moves(OCLLS["Sidebars"])
-            break
+                alg = OCLLS["Sidebars"]
         elif co_state == [False, True, False, True]:
-            if cube.get_sticker("RUF") != WHITE:
-                cube.do_moves("U2")
-            cube.do_moves(OCLLS["Fish"])
-            break
+            if stickers_after_u(cube, ["RUF"], turns)[0] != WHITE:
+                turns += 2
+            alg = OCLLS["Fish"]
         else:
-            cube.do_moves("U")
+            continue
+
+        cube.do_moves(U_TURNS[turns % 4] + " " + alg)
+        break
 
 
 def solve_cpll(cube: Cube):
-    alg = "R' U L' U2 R U' R' U2 R L "
+    for turns in range(4):
+        fur, ful, blu, bru, fru, flu = stickers_after_u(cube, ["FUR", "FUL", "BLU", "BRU", "FRU", "FLU"], turns)
 
-    for _ in range(4):
-        if cube.get_sticker("FUR") == cube.get_sticker("FUL") and cube.get_sticker("BLU") == cube.get_sticker("BRU"):
+        if fur == ful and blu == bru:
+            cube.do_moves(U_TURNS[turns])
             break
 
-        if cube.get_sticker("FRU") == cube.get_sticker("FLU"):
-            cube.do_moves(alg)
+        if fru == flu:
+            cube.do_moves(U_TURNS[turns] + " " + CPLL_ALG)
             break
-        cube.do_moves("U")
     else:
-        cube.do_moves(alg + " U " + alg)
+        cube.do_moves(CPLL_ALG + " U " + CPLL_ALG)
 
 
 def solve_epll(cube: Cube):
-    solved_edges = 0
+    def is_edge_solved(turns):
+        edge, corner = stickers_after_u(cube, ["FU", "FUR"], turns)
+        return edge == corner
 
-    for _ in range(4):
-        if cube.get_sticker("FU") == cube.get_sticker("FUR"):
-            solved_edges += 1
-        cube.do_moves("U")
+    solved_edges = sum(is_edge_solved(turns) for turns in range(4))
 
     if solved_edges != 4:
         if solved_edges == 0:
-            cube.do_moves("R U' R U R U R U' R' U' R2")
+            cube.do_moves(EPLL_ALG)
 
-        while cube.get_sticker("FU") != cube.get_sticker("FUR"):
-            cube.do_moves("U")
+        turns = 0
+        while not is_edge_solved(turns):
+            turns += 1
 
-        cube.do_moves("U2")
+        cube.do_moves(U_TURNS[(turns + 2) % 4])
 
         while cube.get_sticker("FU") != cube.get_sticker("FUR"):
-            cube.do_moves("R U' R U R U R U' R' U' R2")
+            cube.do_moves(EPLL_ALG)
+
+    def is_aligned(turns):
+        edge, centre_edge = stickers_after_u(cube, ["FU", "FR"], turns)
+        return edge == centre_edge
+
+    turns = 0
+    while not is_aligned(turns):
+        turns += 1
 
-    while cube.get_sticker("FU") != cube.get_sticker("FR"):
-        cube.do_moves("U") 
\ No newline at end of file
+    cube.do_moves(U_TURNS[turns % 4]) 
\ No newline at end of file
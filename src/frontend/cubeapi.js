@@ -9,6 +9,11 @@ let scrambledState = null; // Stores the scrambled cube state
 let needsScrambledRestore = false; // Flag to restore to scrambled state before solving
 let isScrambled = false; // Flag to track if cube has been scrambled since last reset
 
+// Colour letter of each colour ID in the packed cube state
+const COLOUR_LETTERS = ['W', 'G', 'O', 'B', 'R', 'Y'];
+// Order of the faces in the packed cube state (9 stickers each)
+const STATE_FACES = ['up', 'front', 'left', 'back', 'right', 'down'];
+
 function showStatus(message, type = 'success') {
     const status = document.getElementById('status');
     status.textContent = message;
@@ -20,13 +25,30 @@ function showStatus(message, type = 'success') {
     }, 5000);
 }
 
+// Unpack the server's hex sticker state into per-face colour letter arrays
+function decodeCubeState(cubeState) {
+    const decoded = { is_solved: cubeState.is_solved };
+    
+    STATE_FACES.forEach((face, f) => {
+        const colors = [];
+        for (let i = 0; i < 9; i++) {
+            const offset = 2 * (f * 9 + i);
+            colors.push(COLOUR_LETTERS[parseInt(cubeState.state.substr(offset, 2), 16)]);
+        }
+        decoded[face] = colors;
+    });
+    
+    return decoded;
+}
+
 function updateCubeDisplay() {
     fetch('/api/state')
         .then(response => response.json())
         .then(data => {
             if (data.status === 'success' && data.cube_state) {
-                renderCube(data.cube_state);
-                update3DCube(data.cube_state);
+                const cubeState = decodeCubeState(data.cube_state);
+                renderCube(cubeState);
+                update3DCube(cubeState);
             } else {
                 renderDefaultCube();
             }
@@ -16,6 +16,10 @@ This optimization is particularly important for generated solutions which
 often contain redundant move sequences.
 """
 
+from typing import List
+from ..cube.move import Move
+from .parser import scramble_to_moves, moves_to_scramble
+
 
 def clean_moves(scramble):
     """
@@ -25,6 +29,9 @@ def clean_moves(scramble):
     on the same face that can be combined or cancelled. The optimization
     reduces the total move count and creates cleaner, more efficient sequences.
     
+    The string is parsed, merged with merge_moves (which holds the
+    cancellation rules) and written back in standard notation.
+    
     Args:
         scramble (str): Space-separated move sequence to optimize
         
@@ -41,109 +48,51 @@ def clean_moves(scramble):
         
     The function handles all standard notation including normal moves,
     prime moves ('), and double moves (2).
+    
+    Raises:
+        ValueError: If a token is not a valid move
     """
-    split_scramble = scramble.split()
-    seq = 0
-
-    while seq < len(split_scramble):
-        try:
-            # Check if current and next move are on the same face
-            if split_scramble[seq][0] == split_scramble[seq + 1][0]:
-                # Process based on first move type
-                if not is_prime(split_scramble[seq]) and not is_double(split_scramble[seq]):
-                    # First move is normal (90° clockwise)
-                    if not is_prime(split_scramble[seq + 1]) and not is_double(split_scramble[seq + 1]):
-                        # Normal + Normal = Double (R R → R2)
-                        del split_scramble[seq + 1]
-                        split_scramble[seq] += "2"
-
-                    elif is_prime(split_scramble[seq + 1]):
-                        # Normal + Prime = Cancellation (R R' → [removed])
-                        del split_scramble[seq], split_scramble[seq]
-
-                    elif is_double(split_scramble[seq + 1]):
-                        # Normal + Double = Prime (R R2 → R')
-                        del split_scramble[seq + 1]
-                        split_scramble[seq] += "'"
-
-                elif is_prime(split_scramble[seq]):
-                    # First move is prime (90° counter-clockwise)
-                    if not is_prime(split_scramble[seq + 1]) and not is_double(split_scramble[seq + 1]):
-                        # Prime + Normal = Cancellation (R' R → [removed])
-                        del split_scramble[seq], split_scramble[seq]
-
-                    elif is_prime(split_scramble[seq + 1]):
-                        # Prime + Prime = Double (R' R' → R2)
-                        del split_scramble[seq + 1]
-                        split_scramble[seq] = split_scramble[seq][0] + "2"
-
-                    elif is_double(split_scramble[seq + 1]):
-                        # Prime + Double = Normal (R' R2 → R)
-                        del split_scramble[seq + 1]
-                        split_scramble[seq] = split_scramble[seq][0]
-
-                elif is_double(split_scramble[seq]):
-                    # First move is double (180°)
-                    if not is_prime(split_scramble[seq + 1]) and not is_double(split_scramble[seq + 1]):
-                        # Double + Normal = Prime (R2 R → R')
-                        del split_scramble[seq]
-                        split_scramble[seq] = split_scramble[seq][0] + "'"
-
-                    elif is_prime(split_scramble[seq + 1]):
-                        # Double + Prime = Normal (R2 R' → R)
-                        del split_scramble[seq + 1]
-                        split_scramble[seq] = split_scramble[seq][0]
-
-                    elif is_double(split_scramble[seq + 1]):
-                        # Double + Double = Cancellation (R2 R2 → [removed])
-                        del split_scramble[seq], split_scramble[seq]
-                
-                # Step back to check for further optimizations after change
-                seq -= 1
-        except IndexError:
-            # Reached end of sequence
-            break
-        seq += 1
-
-    return " ".join(split_scramble)
+    return moves_to_scramble(merge_moves(scramble_to_moves(scramble)))
 
 
-def is_double(move):
+def merge_moves(moves: List[Move]) -> List[Move]:
     """
-    Check if a move is a double turn (180°).
+    Merge runs of consecutive moves on the same face into single moves.
+    
+    The moves are read in one pass onto a stack of (face, quarter turns)
+    pairs. A move on the same face as the top of the stack is added to it
+    mod 4: a total of 0 drops the entry, which may expose a further merge
+    underneath (R U U' R → R2), 2 becomes a double move and 1 or 3 a
+    normal or prime move. Moves are never carried past a different face.
     
     Args:
-        move (str): Move in standard notation
+        moves (List[Move]): Move sequence to merge
         
     Returns:
-        bool: True if move contains '2' notation
+        List[Move]: Equivalent move sequence with no two neighbouring
+                    moves on the same face
+        
+    Examples:
+        >>> merge_moves(scramble_to_moves("R R R U U'"))
+        [Move('R', True, False)]  # R'
     """
-    try:
-        if move[1] == "2":
-            return True
-        else:
-            return False
-    except IndexError:
-        return False
+    merged = []  # (face, quarter turns) pairs
+    # Bound once, outside the loop
+    push, pop = merged.append, merged.pop
 
+    for move in moves:
+        face = move.face
+        turns = 2 if move.double else 3 if move.invert else 1
 
-def is_prime(move):
-    """
-    Check if a move is a prime turn (counter-clockwise).
-    
-    Args:
-        move (str): Move in standard notation
-        
-    Returns:
-        bool: True if move contains ' notation
-    """
-    try:
-        if move[1] == "'":
-            return True
-        else:
-            return False
-    except IndexError:
-        return False
+        if merged and merged[-1][0] == face:
+            turns = (pop()[1] + turns) % 4
+
+            if turns == 0:
+                continue
+
+        push((face, turns))
+
+    return [Move(face, turns == 3, turns == 2) for face, turns in merged]
 
 
 if __name__ == "__main__":
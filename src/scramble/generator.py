@@ -18,6 +18,17 @@ from typing import List
 import random
 
 
+# Standard cube face notation
+FACES = ("U", "R", "L", "B", "D", "F")
+
+# Move modifiers (normal, double, prime) and their relative odds
+SUFFIXES = ("", "2", "'")
+SUFFIX_WEIGHTS = (1, 1, 2)
+
+# Number of moves in a scramble
+SCRAMBLE_LENGTH = 40
+
+
 def gen_n_scrambles(n: int) -> List[str]:
     """
     Generate multiple random scramble sequences.
@@ -28,12 +39,7 @@ def gen_n_scrambles(n: int) -> List[str]:
     Returns:
         List[str]: List of scramble strings in standard notation
     """
-    scrambles = []
-
-    for _ in range(n):
-        scrambles.append(gen_scramble())
-
-    return scrambles
+    return [gen_scramble() for _ in range(n)]
 
 
 def gen_scramble() -> str:
@@ -42,32 +48,27 @@ def gen_scramble() -> str:
     
     Creates a 40-move scramble using standard Rubik's cube notation.
     The sequence uses random face rotations with random modifiers
-    (normal, double, or prime moves).
+    (normal, double, or prime moves). No two consecutive moves turn the
+    same face: each face is the previous one shifted by a random 1-5 places
+    in FACES, which picks uniformly among the other five faces.
     
     Returns:
         str: Scramble sequence in standard notation (e.g., "R U R' D2 F")
         
     Note:
         - Uses all 6 faces: U(p), R(ight), L(eft), B(ack), D(own), F(ront)
-        - Includes normal (90°), double (180°), and prime (270°) rotations
+        - Never repeats a face twice in a row, so no moves cancel or merge
+        - Includes normal (90°), double (180°), and prime (270°) rotations,
+          with prime moves drawn half of the time
         - 40 moves provides sufficient randomization for practice
     """
-    # Standard cube face notation
-    moves = ["U", "R", "L", "B", "D", "F"]
-    scramble = []
+    face = random.randrange(len(FACES))
+    faces = [FACES[face]]
 
-    for _ in range(40):
-        # Generate random move type (0-3 for better distribution)
-        rand_num = random.randint(0, 3)
+    for shift in random.choices(range(1, len(FACES)), k=SCRAMBLE_LENGTH - 1):
+        face = (face + shift) % len(FACES)
+        faces.append(FACES[face])
 
-        if rand_num == 0:
-            # Normal 90-degree move
-            scramble.append(random.choice(moves))
-        elif rand_num == 1:
-            # 180-degree double move
-            scramble.append(random.choice(moves) + "2")
-        else:
-            # 90-degree counter-clockwise (prime) move
-            scramble.append(random.choice(moves) + "'")
+    suffixes = random.choices(SUFFIXES, weights=SUFFIX_WEIGHTS, k=SCRAMBLE_LENGTH)
 
-    return " ".join(scramble)
+    return " ".join(face + suffix for face, suffix in zip(faces, suffixes))
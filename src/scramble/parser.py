@@ -15,16 +15,36 @@ The parser correctly handles:
 - Move sequence inversion for undo operations
 """
 
-from typing import List, Tuple
-from ..cube.move import Move
+from typing import Dict, Final, List, Tuple
+from ..cube.move import Move, MOVES_BY_CODE
 
 
+# Shared Move for every token the parser accepts ("R", "R'", "R2", "R2'", ...).
+# Moves are frozen, so every parse hands out these same instances.
+MOVE_TOKENS: Final[Dict[str, Move]] = {
+    move.face + ("2" if move.double else "") + ("'" if move.invert else ""): move
+    for move in MOVES_BY_CODE
+}
+# A double prime may also be written prime first ("R'2"), as the parser
+# has always accepted
+MOVE_TOKENS.update({
+    move.face + "'2": move for move in MOVES_BY_CODE if move.double and move.invert
+})
+
+# Shared inverse of every move: flipping the invert bit of its move code
+# (normal ↔ prime, a double keeps its double flag)
+INVERSE_MOVES: Final[Dict[Move, Move]] = {move: MOVES_BY_CODE[code ^ 1] for code, move in enumerate(MOVES_BY_CODE)}
+
+# Shared inverse Move for every accepted token, for parsing straight to an undo
+INVERSE_TOKENS: Final[Dict[str, Move]] = {token: INVERSE_MOVES[move] for token, move in MOVE_TOKENS.items()}
+
 def scramble_to_moves(scramble: str) -> List[Move]:
     """
     Convert a scramble string to a list of Move objects.
     
-    Parses standard cube notation and creates structured Move objects
-    that can be executed by the cube engine.
+    Parses standard cube notation into structured Move objects that can
+    be executed by the cube engine. Each token is looked up in MOVE_TOKENS,
+    so no Move is constructed while parsing.
     
     Args:
         scramble (str): Space-separated move sequence (e.g., "R U R' D2")
@@ -32,20 +52,17 @@ def scramble_to_moves(scramble: str) -> List[Move]:
     Returns:
         List[Move]: List of Move objects representing the scramble
         
+    Raises:
+        ValueError: If a token is not a valid move
+        
     Examples:
         >>> scramble_to_moves("R U' F2")
         [Move('R', False, False), Move('U', True, False), Move('F', False, True)]
     """
-    moves = []
-
-    for move in scramble.split():
-        is_prime = "'" in move    # Check for counter-clockwise notation
-        is_double = "2" in move   # Check for double-turn notation
-        face = move[0]            # Extract face letter (F, R, U, L, B, D)
-        
-        moves.append(Move(face, is_prime, is_double))
-
-    return moves
+    try:
+        return [MOVE_TOKENS[move] for move in scramble.split()]
+    except KeyError as e:
+        raise ValueError(f"Not a valid move: {e.args[0]}") from None
 
 
 def moves_to_scramble(moves: List[Move]) -> str:
@@ -66,19 +83,9 @@ def moves_to_scramble(moves: List[Move]) -> str:
         >>> moves_to_scramble(moves)
         "R U'"
     """
-    scramble = []
-
-    for move in moves:
-        cur_move = move.face
-        
-        if move.double:
-            cur_move += "2"      # Add double notation
-        elif move.invert:
-            cur_move += "'"      # Add prime notation
-
-        scramble.append(cur_move)
-    
-    return " ".join(scramble)
+    # Double notation wins over prime notation, as in "R2"
+    return " ".join([move.face + ("2" if move.double else "'" if move.invert else "")
+                     for move in moves])
 
 
 def invert_moves(moves: List[Move]) -> List[Move]:
@@ -87,7 +94,8 @@ def invert_moves(moves: List[Move]) -> List[Move]:
     
     Generates a move sequence that undoes the given moves by:
     - Reversing the order of moves
-    - Inverting each move (normal ↔ prime, double stays double)
+    - Inverting each move (normal ↔ prime, double stays double) through
+      the shared INVERSE_MOVES table, so no Move is constructed
     
     Args:
         moves (List[Move]): Original move sequence
@@ -100,14 +108,33 @@ def invert_moves(moves: List[Move]) -> List[Move]:
         >>> invert_moves(original)
         [Move('U', True, False), Move('R', True, False)]  # U' R'
     """
-    inverted_moves = []
+    return [INVERSE_MOVES[move] for move in reversed(moves)]
 
-    for move in reversed(moves):
-        # Invert the move: normal ↔ prime, double stays the same
-        inverted_move = Move(move.face, not move.invert, move.double)
-        inverted_moves.append(inverted_move)
 
-    return inverted_moves
+def inverse_scramble(scramble: str) -> List[Move]:
+    """
+    Parse a scramble string straight into the moves that undo it.
+    
+    Same result as invert_moves(scramble_to_moves(scramble)), in a single
+    pass over the tokens through INVERSE_TOKENS.
+    
+    Args:
+        scramble (str): Space-separated move sequence (e.g., "R U R' D2")
+        
+    Returns:
+        List[Move]: Inverted move sequence that undoes the scramble
+        
+    Raises:
+        ValueError: If a token is not a valid move
+        
+    Examples:
+        >>> moves_to_scramble(inverse_scramble("R U' F2"))
+        "F2 U R'"
+    """
+    try:
+        return [INVERSE_TOKENS[move] for move in reversed(scramble.split())]
+    except KeyError as e:
+        raise ValueError(f"Not a valid move: {e.args[0]}") from None
 
 
 if __name__ == "__main__":
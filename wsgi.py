@@ -0,0 +1,15 @@
+"""
+WSGI Entry Point
+
+Exposes the Flask application for production WSGI servers. Run with:
+
+    gunicorn -k gthread -w 1 --threads 8 -b 0.0.0.0:5000 wsgi:app
+
+A single worker process is used because cube sessions live in that
+process's memory; its threads serve requests concurrently while solves
+run in the application's process pool.
+"""
+
+from src.app import app
+
+__all__ = ['app']